@@ -7,7 +7,7 @@ from torch.utils.data import DataLoader
 from functools import partial
 
 
-__all__ = ["Sequence", "FullBatchSequence", "NullSequence", "NodeSequence", "FastGCNBatchSequence", "NodeLabelSequence", "SAGESequence", "PyGSAGESequence", "SBVATSampleSequence", "MiniBatchSequence", "FeatureLabelSequence"]
+__all__ = ["Sequence", "FullBatchSequence", "NullSequence", "NodeSequence", "FastGCNBatchSequence", "NodeLabelSequence", "SAGESequence", "PyGSAGESequence", "SBVATSampleSequence", "MiniBatchSequence", "FeatureLabelSequence", "NeighborSampleSequence"]
 
 
 def tolist(array):
@@ -264,3 +264,65 @@ class MiniBatchSequence(Sequence):
             return inputs, y, out_index
         else:
             return inputs, y, out_index, node_ids
+
+
+class NeighborSampleSequence(Sequence):
+    """Mini-batch sequence over induced subgraphs of sampled neighborhoods.
+
+    For each batch of root nodes, at most `size` neighbors per node are
+    sampled for each hop in `sizes`, and the subgraph induced by the
+    root nodes and all the sampled neighbors is returned. The root nodes
+    always come first in the subgraph, so the outputs for them are
+    the first `len(nodes)` rows.
+
+    Parameters
+    ----------
+    inputs : [node feature matrix, adjacency matrix],
+        the adjacency matrix could only be scipy sparse matrix.
+    nodes: the root nodes to be sampled.
+    y: if not None, the labels of `nodes`.
+    sizes: the number of neighbors sampled for each hop, `-1` means the whole neighbor set.
+    adj_transform: if not None, a callable applied on the subgraph adjacency matrix,
+        such as the Chebyshev basis used in ChebyNet.
+    """
+
+    def __init__(
+        self,
+        inputs,
+        nodes,
+        y=None,
+        sizes=(10, 10),
+        adj_transform=None,
+        **kwargs
+    ):
+        super().__init__(list(range(len(nodes))), collate_fn=self.collate_fn, **kwargs)
+        self.feat, adj_matrix = inputs
+        assert sp.isspmatrix(adj_matrix), "node adjacency matrix could only be scipy sparse matrix"
+        self.adj_matrix = adj_matrix.tocsr()
+        self.nodes = np.asarray(nodes)
+        self.y = y
+        self.sizes = sizes
+        self.adj_transform = adj_transform
+        self.neighbor_sampler = gg.data.NeighborSampler(self.adj_matrix)
+
+    def collate_fn(self, ids):
+        nodes = self.nodes[ids]
+        sub_nodes = self.sampling(nodes)
+        adj_matrix = self.adj_matrix[sub_nodes][:, sub_nodes]
+        if self.adj_transform is not None:
+            adj_matrix = self.adj_transform(adj_matrix)
+        y = self.y[ids] if self.y is not None else None
+        out_index = np.arange(nodes.size)
+        # ((node feature matrix, adjacency matrix) of the subgraph, node labels, out_index)
+        return self.astensors((self.feat[sub_nodes], adj_matrix), y, out_index)
+
+    def sampling(self, nodes):
+        sub_nodes = frontier = nodes
+        for size in self.sizes:
+            if frontier.size == 0:
+                break
+            _, nbrs = self.neighbor_sampler.sample(frontier, size=size, replace=False, as_numpy=True)
+            # only the newly reached nodes are expanded in the next hop
+            frontier = np.setdiff1d(nbrs, sub_nodes)
+            sub_nodes = np.concatenate([sub_nodes, frontier])
+        return sub_nodes
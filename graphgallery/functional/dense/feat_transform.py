@@ -1,3 +1,4 @@
+import torch
 import numpy as np
 import scipy.sparse as sp
 
@@ -95,7 +96,7 @@ def normalize_feat(x, *, norm='l1'):
 
     Parameters
     ----------
-    x: Numpy array-like matrix
+    x: Numpy array-like matrix or PyTorch Tensor
     norm: The specified type for the normalization.
         'l1': l1-norm for axis 1, from `sklearn.preprocessing`.
         'l1_0': l1-norm for axis 0, from `sklearn.preprocessing`.
@@ -108,13 +109,17 @@ def normalize_feat(x, *, norm='l1'):
 
     Returns
     -------
-    A normalized feature matrix in Numpy format.
+    A normalized feature matrix in Numpy format,
+    or a Tensor on the same device if `x` is a Tensor.
     """
     if callable(norm):
         return norm(x)
     if norm not in {'l1', 'l1_0', 'zscore', 'robust_scale', None}:
         raise ValueError(f'{norm} is not a supported norm.')
 
+    if torch.is_tensor(x):
+        return _normalize_feat_tensor(x, norm=norm)
+
     if norm == 'l1':
         x_norm = preprocessing.normalize(x, norm='l1', axis=1)
     elif norm == 'l1_0':
@@ -127,3 +132,20 @@ def normalize_feat(x, *, norm='l1'):
     else:
         x_norm = x.copy()
     return x_norm
+
+
+def _normalize_feat_tensor(x, *, norm='l1'):
+    # computed on the device of `x`, without a round trip through the host
+    if norm == 'l1':
+        x_norm = x / x.abs().sum(dim=1, keepdim=True).clamp(min=1e-12)
+    elif norm == 'l1_0':
+        x_norm = x / x.abs().sum(dim=0, keepdim=True).clamp(min=1e-12)
+    elif norm == 'zscore':
+        std = x.std(dim=0, unbiased=False, keepdim=True)
+        x_norm = (x - x.mean(dim=0, keepdim=True)) / torch.where(std > 0, std, torch.ones_like(std))
+    elif norm == 'robust_scale':
+        x_norm = preprocessing.RobustScaler().fit_transform(x.cpu().numpy())
+        x_norm = torch.as_tensor(x_norm, dtype=x.dtype, device=x.device)
+    else:
+        x_norm = x.clone()
+    return x_norm
@@ -1,7 +1,7 @@
 from .normalize_adj import NormalizeAdj, normalize_adj
 from .self_loop import add_self_loop, remove_self_loop, AddSelfLoop, RemoveSelfLoop
 from .wavelet import WaveletBasis, wavelet_basis
-from .chebyshef import ChebyBasis, cheby_basis
+from .chebyshef import ChebyBasis, cheby_basis, clear_basis_cache, stack_basis
 from .to_neighbor_matrix import ToNeighborMatrix, to_neighbor_matrix
 from .gdc import GDC, gdc
 from .reshape import SparseReshape, sparse_reshape
@@ -1,4 +1,9 @@
+import hashlib
+import numba
+import numpy as np
 import scipy.sparse as sp
+from numba import njit, prange
+from collections import OrderedDict
 
 from .normalize_adj import normalize_adj
 from ..transform import SparseTransform
@@ -8,36 +13,184 @@ from ..transform import Transform
 
 @Transform.register()
 class ChebyBasis(SparseTransform):
-    def __init__(self, K=2, rate=-0.5):
+    def __init__(self, K=2, rate=-0.5, cache=True):
         super().__init__()
         self.collect(locals())
 
     def __call__(self, adj_matrix):
-        return cheby_basis(adj_matrix, K=self.K, rate=self.rate)
+        return cheby_basis(adj_matrix, K=self.K, rate=self.rate, cache=self.cache)
+
+
+# the most recently computed Chebyshev basis, keyed by the content of adjacency matrix
+_CACHE_SIZE = 8
+_basis_cache = OrderedDict()
+
+
+def _adj_key(adj_matrix):
+    adj_matrix = adj_matrix.tocsr()
+    h = hashlib.blake2b(digest_size=16)
+    for array in (adj_matrix.indptr, adj_matrix.indices, adj_matrix.data):
+        h.update(np.ascontiguousarray(array).tobytes())
+    return adj_matrix.shape, adj_matrix.dtype.str, h.hexdigest()
+
+
+def clear_basis_cache():
+    """Release the Chebyshev basis cached by `cheby_basis`."""
+    _basis_cache.clear()
 
 
 @multiple()
-def cheby_basis(adj_matrix, K=2, rate=-0.5):
-    """Calculate Chebyshev polynomials up to K k. Return a list of sparse matrices (tuple representation)."""
+def cheby_basis(adj_matrix, K=2, rate=-0.5, cache=True):
+    """Calculate Chebyshev polynomials up to K k. Return a list of sparse matrices (tuple representation).
+
+    If `cache=True`, the results for the last few distinct inputs are cached, so that
+    repeated calls with the same adjacency matrix (e.g., hyperparameter search) are
+    computed only once. The cache can be released by `clear_basis_cache`.
+    """
 
     assert K >= 2, K
+    if not cache:
+        return _cheby_basis(adj_matrix, K=K, rate=rate)
+
+    key = (_adj_key(adj_matrix), K, rate)
+    t_k = _basis_cache.get(key, None)
+    if t_k is None:
+        t_k = _cheby_basis(adj_matrix, K=K, rate=rate)
+        _basis_cache[key] = t_k
+        if len(_basis_cache) > _CACHE_SIZE:
+            _basis_cache.popitem(last=False)
+    else:
+        _basis_cache.move_to_end(key)
+    # copies are returned so that the cached basis is never modified inplace
+    return [T.copy() for T in t_k]
+
+
+def _cheby_basis(adj_matrix, K=2, rate=-0.5):
     adj_normalized = normalize_adj(adj_matrix, rate=rate, add_self_loop=True)
     I = sp.eye(adj_matrix.shape[0], dtype=adj_matrix.dtype, format='csr')
     laplacian = I - adj_normalized
-    largest_eigval = sp.linalg.eigsh(laplacian,
-                                     1,
-                                     which='LM',
-                                     return_eigenvectors=False)[0]
-    scaled_laplacian = (2. / largest_eigval) * laplacian - I
+    if laplacian.count_nonzero() == 0 or adj_matrix.shape[0] < 3:
+        # ARPACK fails on an empty Laplacian (a graph without edges) or a tiny graph,
+        # e.g., a sampled subgraph, the upper bound of the eigenvalues is used instead
+        largest_eigval = 2.
+    else:
+        largest_eigval = sp.linalg.eigsh(laplacian,
+                                         1,
+                                         which='LM',
+                                         return_eigenvectors=False)[0]
+    scaled_laplacian = ((2. / largest_eigval) * laplacian - I).tocsr()
 
     t_k = []
     t_k.append(I)
     t_k.append(scaled_laplacian)
 
-    def chebyshev_recurrence(t_k_minus_one, t_k_minus_two, scaled_lap):
-        return 2 * scaled_lap.dot(t_k_minus_one) - t_k_minus_two
-
+    # 2 * L is computed once, rather than at each step of the recurrence
+    two_laplacian = (2. * scaled_laplacian).tocsr()
     for _ in range(2, K + 1):
-        t_k.append(chebyshev_recurrence(t_k[-1], t_k[-2], scaled_laplacian))
+        t_k.append(chebyshev_recurrence(two_laplacian, t_k[-1], t_k[-2]))
 
     return t_k
+
+
+# below this number of nonzeros in the Laplacian, scipy is as fast as the Numba kernel,
+# which would only add its compilation (or loading from cache) on the first call
+_NUMBA_MIN_NNZ = 100000
+
+
+def chebyshev_recurrence(two_laplacian, t_k_minus_one, t_k_minus_two):
+    """Compute `two_laplacian @ t_k_minus_one - t_k_minus_two` for CSR matrices
+    in a single fused (and parallel) pass, without the intermediate product,
+    where `two_laplacian` is the (scaled) Laplacian multiplied by 2 in advance."""
+    if two_laplacian.nnz < _NUMBA_MIN_NNZ:
+        return (two_laplacian @ t_k_minus_one - t_k_minus_two).tocsr()
+    indptr, indices, data = _chebyshev_recurrence(two_laplacian.indptr, two_laplacian.indices, two_laplacian.data,
+                                                  t_k_minus_one.indptr, t_k_minus_one.indices, t_k_minus_one.data,
+                                                  t_k_minus_two.indptr, t_k_minus_two.indices, t_k_minus_two.data,
+                                                  t_k_minus_one.shape[1], numba.config.NUMBA_NUM_THREADS)
+    return sp.csr_matrix((data, indices, indptr), shape=(two_laplacian.shape[0], t_k_minus_one.shape[1]))
+
+
+@njit(parallel=True, cache=True)
+def _chebyshev_recurrence(L_indptr, L_indices, L_data,
+                          T1_indptr, T1_indices, T1_data,
+                          T2_indptr, T2_indices, T2_data,
+                          num_cols, num_chunks):
+    # rows are split into chunks so that each thread allocates its
+    # dense workspace of size `num_cols` only once
+    N = L_indptr.size - 1
+    chunk_size = (N + num_chunks - 1) // num_chunks
+
+    # symbolic phase: the number of nonzeros in each row
+    nnz = np.zeros(N + 1, dtype=np.int64)
+    for c in prange(num_chunks):
+        mask = np.full(num_cols, -1, dtype=np.int64)
+        for i in range(c * chunk_size, min(N, (c + 1) * chunk_size)):
+            count = 0
+            for p in range(L_indptr[i], L_indptr[i + 1]):
+                j = L_indices[p]
+                for q in range(T1_indptr[j], T1_indptr[j + 1]):
+                    col = T1_indices[q]
+                    if mask[col] != i:
+                        mask[col] = i
+                        count += 1
+            for q in range(T2_indptr[i], T2_indptr[i + 1]):
+                col = T2_indices[q]
+                if mask[col] != i:
+                    mask[col] = i
+                    count += 1
+            nnz[i + 1] = count
+
+    indptr = np.cumsum(nnz)
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    data = np.empty(indptr[-1], dtype=T1_data.dtype)
+
+    # numeric phase: `pos[col]` is the position of `col` in the output,
+    # which belongs to the current row only if it is not less than `indptr[i]`
+    for c in prange(num_chunks):
+        pos = np.full(num_cols, -1, dtype=np.int64)
+        for i in range(c * chunk_size, min(N, (c + 1) * chunk_size)):
+            start = k = indptr[i]
+            for p in range(L_indptr[i], L_indptr[i + 1]):
+                j = L_indices[p]
+                w = L_data[p]
+                for q in range(T1_indptr[j], T1_indptr[j + 1]):
+                    col = T1_indices[q]
+                    if pos[col] < start:
+                        pos[col] = k
+                        indices[k] = col
+                        data[k] = w * T1_data[q]
+                        k += 1
+                    else:
+                        data[pos[col]] += w * T1_data[q]
+            for q in range(T2_indptr[i], T2_indptr[i + 1]):
+                col = T2_indices[q]
+                if pos[col] < start:
+                    pos[col] = k
+                    indices[k] = col
+                    data[k] = -T2_data[q]
+                    k += 1
+                else:
+                    data[pos[col]] -= T2_data[q]
+
+    return indptr, indices, data
+
+
+def stack_basis(basis):
+    """Stack a list of K (N, M) sparse matrices [T_0, T_1, ..., T_{K-1}]
+    as a single (N, M*K) CSR matrix with column `m*K+k` being the
+    `m`-th column of `T_k`.
+
+    With this interleaved layout, `sum_k T_k @ H_k` is computed by a single
+    sparse matmul with `H` of shape (M, K, F) viewed as (M*K, F),
+    where `H[:, k]` is `H_k`, and no transposed copy of `H` is required.
+    The nonzeros of all the K matrices at position `(n, m)` are adjacent
+    in row `n`, so this is also the shared-index layout of the basis, without
+    padding the sparsity pattern of each `T_k` to their union.
+    """
+    K = len(basis)
+    basis = [T.tocoo() for T in basis]
+    N, M = basis[0].shape
+    row = np.concatenate([T.row for T in basis])
+    col = np.concatenate([T.col * K + k for k, T in enumerate(basis)])
+    data = np.concatenate([T.data for T in basis])
+    return sp.csr_matrix((data, (row, col)), shape=(N, M * K))
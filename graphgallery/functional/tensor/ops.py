@@ -7,6 +7,7 @@ import graphgallery as gg
 from graphgallery import functional as gf
 
 __all__ = ["sparse_adj_to_sparse_tensor",
+           "sparse_adj_to_sparse_csr_tensor",
            "sparse_tensor_to_sparse_adj",
            "sparse_edge_to_sparse_tensor",
            "infer_type",
@@ -86,8 +87,43 @@ def sparse_adj_to_sparse_tensor(x, dtype=None):
                                         x.shape)
 
 
+def sparse_adj_to_sparse_csr_tensor(x, dtype=None):
+    """Converts a Scipy sparse matrix to a PyTorch SparseTensor
+    in CSR layout, which is built from the CSR arrays of `x` directly.
+
+    Parameters
+    ----------
+    x: Scipy sparse matrix
+        Matrix in Scipy sparse format.
+
+    Returns
+    -------
+    S: SparseTensor
+        Matrix as a pytorch sparse tensor with `torch.sparse_csr` layout.
+    """
+
+    if dtype is None:
+        dtype = infer_type(x)
+
+    elif isinstance(dtype, torch.dtype):
+        dtype = str(dtype).split('.')[-1]
+
+    if not isinstance(dtype, str):
+        raise TypeError(dtype)
+
+    x = x.tocsr(copy=True)
+    # sorted and duplicate-free indices, as the coalesced COO tensor
+    x.sum_duplicates()
+    return torch.sparse_csr_tensor(torch.from_numpy(x.indptr.astype(_intx)),
+                                   torch.from_numpy(x.indices.astype(_intx)),
+                                   torch.from_numpy(x.data.astype(dtype, copy=False)),
+                                   size=x.shape)
+
+
 def sparse_tensor_to_sparse_adj(x: torch.Tensor) -> sp.csr_matrix:
     """Converts a SparseTensor to a Scipy sparse matrix (CSR matrix)."""
+    if x.layout == torch.sparse_csr:
+        x = x.to_sparse_coo()
     x = x.coalesce()
     data = x.values().detach().cpu().numpy()
     indices = x.indices().detach().cpu().numpy()
@@ -6,10 +6,11 @@ import graphgallery as gg
 from typing import Any
 
 from graphgallery import functional as gf
-from .ops import sparse_adj_to_sparse_tensor
+from .ops import sparse_adj_to_sparse_tensor, sparse_adj_to_sparse_csr_tensor
 
 _TYPE = {
     'float16': torch.float16,
+    'bfloat16': torch.bfloat16,
     'float32': torch.float32,
     'float64': torch.float64,
     'uint8': torch.uint8,
@@ -30,14 +31,14 @@ def is_tensor(x: Any) -> bool:
 
 
 def is_sparse(x: Any) -> bool:
-    return is_tensor(x) and x.is_sparse
+    return is_tensor(x) and x.layout != torch.strided
 
 
 def is_dense(x: Any) -> bool:
-    return is_tensor(x) and not x.is_sparse
+    return is_tensor(x) and x.layout == torch.strided
 
 
-def astensor(x, *, dtype=None, device=None, escape=None) -> torch.Tensor:
+def astensor(x, *, dtype=None, device=None, escape=None, sparse_format='coo') -> torch.Tensor:
 
     try:
         if x is None or (escape is not None and isinstance(x, escape)):
@@ -49,7 +50,7 @@ def astensor(x, *, dtype=None, device=None, escape=None) -> torch.Tensor:
     if isinstance(x, dict):
         for k, v in x.items():
             try:
-                x[k] = astensor(v, dtype=dtype, device=device, escape=escape)
+                x[k] = astensor(v, dtype=dtype, device=device, escape=escape, sparse_format=sparse_format)
             except TypeError:
                 pass
         return x
@@ -66,6 +67,8 @@ def astensor(x, *, dtype=None, device=None, escape=None) -> torch.Tensor:
 
     if is_tensor(x):
         tensor = x.to(dtype)
+        if sparse_format == 'csr' and tensor.layout == torch.sparse_coo:
+            tensor = tensor.to_sparse_csr()
 
     elif sp.isspmatrix(x):
         if gg.backend() == "dgl":
@@ -88,6 +91,8 @@ def astensor(x, *, dtype=None, device=None, escape=None) -> torch.Tensor:
                              dtype=torch.float32,
                              device=device,
                              escape=escape))
+        elif sparse_format == 'csr':
+            tensor = sparse_adj_to_sparse_csr_tensor(x, dtype=dtype)
         else:
             tensor = sparse_adj_to_sparse_tensor(x, dtype=dtype)
     elif any((isinstance(x, (np.ndarray, np.matrix)), gg.is_listlike(x),
@@ -100,7 +105,7 @@ def astensor(x, *, dtype=None, device=None, escape=None) -> torch.Tensor:
     return tensor.to(device)
 
 
-def astensors(*xs, dtype=None, device=None, escape=None):
+def astensors(*xs, dtype=None, device=None, escape=None, sparse_format='coo'):
     """Convert input matrices to Tensor(s) or SparseTensor(s).
 
     Parameters:
@@ -113,6 +118,8 @@ def astensors(*xs, dtype=None, device=None, escape=None):
         Default: if 'None', uses the CPU device for the default tensor type.     
     escape: a Class or a tuple of Classes, `astensor` will disabled if
         `isinstance(x, escape)`.
+    sparse_format: string, 'coo' or 'csr', optional. the layout of returned
+        SparseTensor(s) for sparse inputs. Default: 'coo'.
 
     Returns:
     -------     
@@ -122,7 +129,8 @@ def astensors(*xs, dtype=None, device=None, escape=None):
     return _astensors_fn(*xs,
                          dtype=dtype,
                          device=device,
-                         escape=escape)
+                         escape=escape,
+                         sparse_format=sparse_format)
 
 
 _astensors_fn = gf.multiple(type_check=False)(astensor)
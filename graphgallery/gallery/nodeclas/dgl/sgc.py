@@ -1,4 +1,5 @@
 import torch
+import numpy as np
 import graphgallery.nn.models.dgl as models
 from graphgallery.data.sequence import FullBatchSequence
 from graphgallery import functional as gf
@@ -20,8 +21,15 @@ class SGC(NodeClasTrainer):
                   feat_transform=None):
         graph = self.graph
         adj_matrix = gf.get(adj_transform)(graph.adj_matrix)
-        attr_matrix = gf.get(feat_transform)(graph.attr_matrix)
+        feat_transform = gf.get(feat_transform)
+        # `normalize_feat` also accepts dense tensors, so the features are normalized
+        # on the data device, other transforms are applied on the host as usual
+        on_device = isinstance(feat_transform, gf.NormalizeFeat) and not callable(feat_transform.norm) \
+            and isinstance(graph.attr_matrix, np.ndarray)
+        attr_matrix = graph.attr_matrix if on_device else feat_transform(graph.attr_matrix)
         feat, g = gf.astensors(attr_matrix, adj_matrix, device=self.data_device)
+        if on_device:
+            feat = feat_transform(feat)
 
         # ``g`` and ``feat`` are cached for later use
         self.register_cache(feat=feat, g=g)
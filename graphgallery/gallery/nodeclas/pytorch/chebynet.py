@@ -1,6 +1,7 @@
 import torch
+import warnings
 import graphgallery.nn.models.pytorch as models
-from graphgallery.data.sequence import FullBatchSequence
+from graphgallery.data.sequence import FullBatchSequence, NeighborSampleSequence
 from graphgallery import functional as gf
 from graphgallery.gallery.nodeclas import PyTorch
 from graphgallery.gallery.nodeclas import NodeClasTrainer
@@ -17,16 +18,46 @@ class ChebyNet(NodeClasTrainer):
 
     def data_step(self,
                   adj_transform=("cheby_basis", dict(K=2)),
-                  feat_transform=None):
+                  feat_transform=None,
+                  adj_dtype=None):
+
+        if adj_dtype is not None:
+            if self.device.type != 'cuda':
+                raise ValueError(f"'adj_dtype={adj_dtype}' requires a CUDA device, "
+                                 f"sparse matmul in lower precision is not supported on '{self.device}'.")
+            if self.cfg.get('sample', False):
+                warnings.warn("'adj_dtype' is ignored for the basis of sampled subgraphs, "
+                              "which are computed in full precision.")
 
         graph = self.graph
-        adj_matrix = gf.get(adj_transform)(graph.adj_matrix)
         attr_matrix = gf.get(feat_transform)(graph.attr_matrix)
 
-        feat, adj = gf.astensors(attr_matrix, adj_matrix, device=self.data_device)
+        if self.cfg.get('sample', False):
+            # the basis is computed on each sampled subgraph in `config_sample_data`,
+            # so the one of the full graph is never built
+            feat = gf.astensor(attr_matrix, device=self.data_device)
+            self.register_cache(feat=feat, K=gf.get(adj_transform).K + 1)
+            return
+
+        adj_matrix = gf.get(adj_transform)(graph.adj_matrix)
+        K = len(adj_matrix)
+        # the basis [T_0, T_1, ..., T_{K-1}] are stacked as a single (N, N*K) matrix
+        # so that all the K propagations are done with one sparse matmul
+        adj_matrix = gf.stack_basis(adj_matrix)
+
+        # converted to CSR once here and reused across epochs
+        feat, adj = gf.astensors(attr_matrix, adj_matrix, device=self.data_device, sparse_format='csr')
+        if adj_dtype is not None:
+            # e.g., 'float16' or 'bfloat16', halving the memory traffic of sparse matmul (CUDA only)
+            adj = gf.astensor(adj, dtype=adj_dtype, device=self.data_device)
+
+        if self.data_device.type == 'cpu' and self.device.type == 'cuda':
+            # inputs are copied to device at each epoch in this case,
+            # page-locked memory makes the copy faster and asynchronous
+            feat, adj = feat.pin_memory(), adj.pin_memory()
 
-        # ``adj`` and ``feat`` are cached for later use
-        self.register_cache(feat=feat, adj=adj)
+        # ``adj``, ``feat`` and ``K`` are cached for later use
+        self.register_cache(feat=feat, adj=adj, K=K)
 
     def model_step(self,
                    hids=[16],
@@ -34,7 +65,7 @@ class ChebyNet(NodeClasTrainer):
                    dropout=0.5,
                    bias=False):
 
-        K = len(self.cache.adj)
+        K = self.cache.K
         model = models.ChebyNet(self.graph.num_feats,
                                 self.graph.num_classes,
                                 hids=hids,
@@ -46,14 +77,49 @@ class ChebyNet(NodeClasTrainer):
         return model
 
     def config_train_data(self, index):
+        if self.cfg.get('sample', False):
+            batch_size_train = self.cfg.get('batch_size_train', 512)
+            return self.config_sample_data(index, batch_size=batch_size_train, shuffle=True)
 
         labels = self.graph.label[index]
-        sequence = FullBatchSequence(inputs=[self.cache.feat, *self.cache.adj],
+        # the cached tensors are passed by identity, otherwise ``adj`` would be
+        # converted (e.g., cast back from `adj_dtype`) each time the sequence is built
+        sequence = FullBatchSequence(inputs=[self.cache.feat, self.cache.adj],
                                      y=labels,
                                      out_index=index,
-                                     device=self.data_device)
+                                     device=self.data_device,
+                                     escape=torch.Tensor)
         return sequence
 
+    def config_test_data(self, index):
+        if self.cfg.get('sample', False):
+            batch_size_test = self.cfg.get('batch_size_test', 20000)
+            return self.config_sample_data(index, batch_size=batch_size_test)
+        return self.config_train_data(index)
+
+    def config_sample_data(self, index, **kwargs):
+        # the Chebyshev basis is recomputed on each sampled subgraph
+        adj_transform = self.transform.adj_transform
+        if isinstance(adj_transform, gf.ChebyBasis):
+            # subgraphs rarely repeat, hashing and caching them would only
+            # evict the basis of the full graph
+            adj_transform = gf.ChebyBasis(K=adj_transform.K, rate=adj_transform.rate, cache=False)
+        labels = self.graph.label[index]
+        sequence = NeighborSampleSequence(inputs=[self.cache.feat, self.graph.adj_matrix],
+                                          nodes=index,
+                                          y=labels,
+                                          sizes=self.cfg.get('sizes', (10, 10)),
+                                          adj_transform=lambda adj: gf.stack_basis(adj_transform(adj)),
+                                          device=self.data_device,
+                                          **kwargs)
+        return sequence
+
+    def train_step(self, dataloader) -> dict:
+        if not self.cfg.get('sample', False):
+            # the CSR conversion is done once in `data_step`, guard against regressions
+            assert self.cache.adj.layout == torch.sparse_csr, self.cache.adj.layout
+        return super().train_step(dataloader)
+
     def config_optimizer(self) -> torch.optim.Optimizer:
         lr = self.cfg.get('lr', 0.01)
         weight_decay = self.cfg.get('weight_decay', 5e-4)
@@ -20,14 +20,16 @@ class SSGC(NodeClasTrainer):
                   adj_transform="normalize_adj",
                   feat_transform=None,
                   K=16,
-                  alpha=0.1):
+                  alpha=0.1,
+                  compiled=False,
+                  block_size=None):
         graph = self.graph
         adj_matrix = gf.get(adj_transform)(graph.adj_matrix)
         attr_matrix = gf.get(feat_transform)(graph.attr_matrix)
 
-        feat, adj = gf.astensors(attr_matrix, adj_matrix, device=self.data_device)
+        feat, adj = gf.astensors(attr_matrix, adj_matrix, device=self.data_device, sparse_format='csr')
 
-        feat = SSGConv(K=K, alpha=alpha)(feat, adj)
+        feat = SSGConv(K=K, alpha=alpha, compiled=compiled, block_size=block_size)(feat, adj)
         # ``adj`` and ``feat`` are cached for later use
         self.register_cache(feat=feat, adj=adj)
 
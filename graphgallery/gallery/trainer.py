@@ -462,6 +462,8 @@ class Trainer:
             the input variable that in the device `self.device`.
         """
         device = self.device
+        # asynchronous copy is only safe from host to device
+        non_blocking = device.type == 'cuda'
 
         def wrapper(inputs):
             if isinstance(inputs, tuple):
@@ -470,6 +472,8 @@ class Trainer:
                 for k, v in inputs.items():
                     inputs[k] = wrapper(v)
                 return inputs
+            elif torch.is_tensor(inputs):
+                return inputs.to(device, non_blocking=non_blocking)
             else:
                 return inputs.to(device) if hasattr(inputs, 'to') else inputs
 
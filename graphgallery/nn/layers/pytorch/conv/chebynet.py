@@ -1,5 +1,4 @@
 import torch.nn as nn
-from .gcn import GCNConv
 
 
 class ChebConv(nn.Module):
@@ -11,18 +10,22 @@ class ChebConv(nn.Module):
         super().__init__()
         self.in_features = in_features
         self.out_features = out_features
-        self.conv = nn.ModuleList(GCNConv(in_features, out_features, bias=bias) for _ in range(K))
+        # weights of all the K basis are stacked as a single linear layer
+        self.w = nn.Linear(in_features, out_features * K, bias=bias)
         self.K = K
 
     def reset_parameters(self):
-        for conv in self.conv:
-            conv.reset_parameters()
+        self.w.reset_parameters()
 
-    def forward(self, x, *adjs):
-        out = 0.
-        for conv, adj in zip(self.conv, adjs):
-            out += conv(x, adj)
-        return out
+    def forward(self, x, adj):
+        """
+        x: (N, in_features) feature matrix
+        adj: (N, N*K) Chebyshev basis [T_0, T_1, ..., T_{K-1}] stacked by `stack_basis`
+        """
+        # (N, K*out_features) -> (N*K, out_features), row `n*K+k` is (x @ W_k)[n]
+        out = self.w(x).view(-1, self.out_features)
+        # the basis may be stored in lower precision, e.g., float16
+        return adj.mm(out.to(adj.dtype)).to(x.dtype)
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.in_features}, {self.out_features}, K={self.K})"
@@ -2,25 +2,56 @@ import torch
 from torch.nn import Module
 
 
+def ssgc_propagate(x, adj, K: int, alpha: float):
+    scale = (1 - alpha) / K
+    # the accumulator starts from the (rescaled) residual term so that
+    # scale * x_out = (1 - alpha) / K * sum_k A^k x + alpha * x
+    x_out = x * (alpha / scale)
+    for _ in range(K):
+        x = torch.sparse.mm(adj, x)
+        x_out.add_(x)
+    return x_out.mul_(scale)
+
+
 class SSGConv(Module):
-    def __init__(self, K=16, alpha=0.1, **kwargs):
+    def __init__(self, K=16, alpha=0.1, compiled=False, block_size=None, **kwargs):
         super().__init__()
         assert K>0
+        assert 0 <= alpha < 1, alpha
         self.K = K
         self.alpha = alpha
+        self.compiled = compiled
+        self.block_size = block_size
+        self._adj = self._sparse_adj = None
+        if compiled:
+            # ``K`` and ``alpha`` are fixed, so the loop could be fully specialized
+            self.propagate = torch.compile(ssgc_propagate, dynamic=False)
+        else:
+            self.propagate = ssgc_propagate
 
     def forward(self, x, adj):
-        x_in = x
-        x_out = torch.zeros_like(x)
-        for _ in range(self.K):
-            x =  torch.spmm(adj, x)
-            x_out += (1 - self.alpha) * x
-        x_out /= self.K
-        x_out += self.alpha * x_in
-        return x_out
+        if adj.layout in (torch.sparse_coo, torch.sparse_csr):
+            # convert only once for the same adjacency matrix
+            if adj is not self._adj:
+                self._adj, self._sparse_adj = adj, self.to_sparse(adj)
+            adj = self._sparse_adj
+        return self.propagate(x, adj, self.K, self.alpha)
+
+    def to_sparse(self, adj):
+        """Convert `adj` to CSR, or to block CSR (BSR) with blocks of
+        `block_size x block_size` if `block_size` is specified and
+        at least 25% of the entries in the nonzero blocks are nonzero."""
+        if adj.layout == torch.sparse_coo:
+            adj = adj.to_sparse_csr()
+        b = self.block_size
+        if b and adj.size(0) % b == 0 and adj.size(1) % b == 0:
+            adj_bsr = adj.to_sparse_bsr((b, b))
+            if adj._nnz() >= 0.25 * adj_bsr.values().numel():
+                return adj_bsr
+        return adj
 
     def reset_parameters(self):
         pass
 
     def extra_repr(self):
-        return f"K={self.K}, alpha={self.alpha}"
+        return f"K={self.K}, alpha={self.alpha}, compiled={self.compiled}, block_size={self.block_size}"
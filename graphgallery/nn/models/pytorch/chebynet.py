@@ -31,5 +31,5 @@ class ChebyNet(nn.Module):
         self.reg_paras = conv[1].parameters()
         self.non_reg_paras = conv[2:].parameters()
 
-    def forward(self, x, *adj):
-        return self.conv(x, *adj)
+    def forward(self, x, adj):
+        return self.conv(x, adj)
@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+import graphgallery as gg
+
+# `NeighborSampler` is backed by the optional `glcore` extension
+pytest.importorskip("glcore")
+
+from graphgallery.data.sequence import NeighborSampleSequence
+
+
+def random_graph(N=100, density=0.05, seed=42):
+    adj = sp.random(N, N, density=density, random_state=seed, format='csr')
+    adj = ((adj + adj.T) > 0).astype('float32')
+    adj.setdiag(0)
+    adj.eliminate_zeros()
+    rng = np.random.RandomState(seed)
+    # node ids can be recovered from the (distinct) feature rows
+    feat = rng.rand(N, 8).astype('float32')
+    label = rng.randint(0, 3, N)
+    return adj.tocsr(), feat, label
+
+
+def test_neighbor_sample_sampling():
+    adj, feat, label = random_graph()
+    roots = np.arange(0, 10)
+    for size in [1, 3]:
+        sequence = NeighborSampleSequence([feat, adj], roots, sizes=(size,))
+        sub_nodes = sequence.sampling(roots)
+        # root nodes come first, without duplicates
+        assert np.array_equal(sub_nodes[:roots.size], roots)
+        assert np.unique(sub_nodes).size == sub_nodes.size
+        # at most `size` neighbors are sampled for each root node
+        new_nodes = sub_nodes[roots.size:]
+        assert np.isin(new_nodes, adj[roots].indices).all()
+        assert new_nodes.size <= roots.size * size
+
+    sequence = NeighborSampleSequence([feat, adj], roots, sizes=(2, 2))
+    sub_nodes = sequence.sampling(roots)
+    assert np.array_equal(sub_nodes[:roots.size], roots)
+    assert sub_nodes.size <= roots.size * (1 + 2 + 2 * 2)
+
+
+def test_neighbor_sample_sequence():
+    adj, feat, label = random_graph()
+    nodes = np.arange(20, 50)
+    sequence = NeighborSampleSequence([feat, adj], nodes, y=label[nodes], sizes=(2, 2), batch_size=10)
+    assert len(sequence) == 3
+    for ids in [list(range(10)), list(range(20, 30))]:
+        roots = nodes[ids]
+        (x, sub_adj), y, out_index = sequence.collate_fn(ids)
+        x = x.numpy()
+        sub_nodes = np.array([np.flatnonzero((feat == row).all(1))[0] for row in x])
+        assert np.array_equal(sub_nodes[:roots.size], roots)
+        assert np.array_equal(out_index.numpy(), np.arange(roots.size))
+        assert np.array_equal(y.numpy(), label[roots])
+        # the subgraph is induced by the sampled nodes
+        assert np.allclose(sub_adj.to_dense().numpy(), adj[sub_nodes][:, sub_nodes].toarray())
+
+
+def test_chebynet_sample():
+    adj, feat, label = random_graph()
+    graph = gg.data.Graph(adj, feat, label)
+    gg.set_backend('torch')
+    from graphgallery.gallery.nodeclas import ChebyNet
+    trainer = ChebyNet(device='cpu', seed=42, sample=True, batch_size_train=16).setup_graph(graph).build()
+    # the basis of the full graph is not built in sampled mode
+    assert 'adj' not in trainer.cache and trainer.cache.K == 3
+    trainer.fit(np.arange(0, 50), np.arange(50, 70), verbose=0, epochs=2)
+    assert 0 <= trainer.evaluate(np.arange(70, 100), verbose=0).accuracy <= 1
+
+
+if __name__ == "__main__":
+    test_neighbor_sample_sampling()
+    test_neighbor_sample_sequence()
+    test_chebynet_sample()
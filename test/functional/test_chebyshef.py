@@ -0,0 +1,98 @@
+import numpy as np
+import scipy.sparse as sp
+from graphgallery import functional as gf
+from graphgallery.functional import cheby_basis, clear_basis_cache, stack_basis
+from graphgallery.functional.sparse import chebyshef
+from graphgallery.functional.sparse.chebyshef import chebyshev_recurrence, _basis_cache
+
+
+def random_adj(N=50, density=0.1, seed=42):
+    adj = sp.random(N, N, density=density, random_state=seed, format='csr')
+    return ((adj + adj.T) > 0).astype('float32')
+
+
+def test_cheby_basis_cache():
+    clear_basis_cache()
+    adj = random_adj()
+    basis = cheby_basis(adj, K=3)
+    assert len(basis) == 4
+    assert len(_basis_cache) == 1
+    entry, = _basis_cache.values()
+    basis[1].data[:] = 0.
+    # the cached basis should not be modified by the previous inplace operation
+    cached = cheby_basis(adj.copy(), K=3)
+    assert abs(cached[1]).sum() > 0
+    # an equal adjacency matrix hits the cache
+    assert len(_basis_cache) == 1
+    assert next(iter(_basis_cache.values())) is entry
+    assert len(cheby_basis(adj, K=2)) == 3
+    assert len(_basis_cache) == 2
+
+    assert len(cheby_basis(random_adj(seed=0), K=3, cache=False)) == 4
+    assert len(_basis_cache) == 2
+    clear_basis_cache()
+    assert len(_basis_cache) == 0
+
+
+def test_cheby_basis_degenerate():
+    # graphs without edges, e.g., sampled subgraphs of isolated nodes
+    for N in (1, 2, 5):
+        adj = sp.csr_matrix((N, N), dtype='float32')
+        basis = cheby_basis(adj, K=2, cache=False)
+        assert len(basis) == 3
+        assert all(np.isfinite(T.toarray()).all() for T in basis)
+    adj = sp.csr_matrix(np.array([[0, 1], [1, 0]], dtype='float32'))
+    assert len(cheby_basis(adj, K=2, cache=False)) == 3
+
+
+def test_cheby_basis():
+    adj = random_adj()
+    N = adj.shape[0]
+    laplacian = np.eye(N) - gf.normalize_adj(adj, rate=-0.5, add_self_loop=True).toarray()
+    scaled_laplacian = 2. / np.linalg.eigvalsh(laplacian).max() * laplacian - np.eye(N)
+    expected = [np.eye(N), scaled_laplacian]
+    for _ in range(3):
+        expected.append(2. * scaled_laplacian @ expected[-1] - expected[-2])
+
+    # both the scipy and the Numba paths of the recurrence
+    for min_nnz in [chebyshef._NUMBA_MIN_NNZ, 0]:
+        min_nnz, chebyshef._NUMBA_MIN_NNZ = chebyshef._NUMBA_MIN_NNZ, min_nnz
+        try:
+            basis = cheby_basis(adj, K=4, cache=False)
+        finally:
+            chebyshef._NUMBA_MIN_NNZ = min_nnz
+        assert len(basis) == 5
+        for T, T_expected in zip(basis, expected):
+            assert np.allclose(T.toarray(), T_expected, atol=1e-4)
+
+
+def test_chebyshev_recurrence():
+    L = random_adj(seed=1)
+    T1 = random_adj(seed=2)
+    T2 = random_adj(seed=3)
+    expected = L @ T1 - T2
+    assert np.allclose(chebyshev_recurrence(L, T1, T2).toarray(), expected.toarray())
+    # small inputs go through scipy, force the Numba kernel
+    min_nnz, chebyshef._NUMBA_MIN_NNZ = chebyshef._NUMBA_MIN_NNZ, 0
+    try:
+        assert np.allclose(chebyshev_recurrence(L, T1, T2).toarray(), expected.toarray())
+    finally:
+        chebyshef._NUMBA_MIN_NNZ = min_nnz
+
+
+def test_stack_basis():
+    adj = random_adj()
+    basis = cheby_basis(adj, K=2)
+    K = len(basis)
+    H = np.random.rand(adj.shape[0], K, 4)
+    out = stack_basis(basis) @ H.reshape(-1, 4)
+    expected = sum(T @ H[:, k] for k, T in enumerate(basis))
+    assert np.allclose(out, expected)
+
+
+if __name__ == "__main__":
+    test_cheby_basis_cache()
+    test_cheby_basis()
+    test_cheby_basis_degenerate()
+    test_chebyshev_recurrence()
+    test_stack_basis()
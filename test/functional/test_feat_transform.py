@@ -0,0 +1,19 @@
+import torch
+import numpy as np
+from graphgallery.functional import normalize_feat
+
+
+def test_normalize_feat_tensor():
+    x = np.random.rand(20, 8).astype('float32')
+    # rows and columns of all zeros
+    x[3] = 0.
+    x[:, 5] = 0.
+    for norm in ['l1', 'l1_0', 'zscore', 'robust_scale', None]:
+        expected = normalize_feat(x, norm=norm)
+        out = normalize_feat(torch.as_tensor(x), norm=norm)
+        assert torch.is_tensor(out)
+        assert np.allclose(out.numpy(), expected, atol=1e-5), norm
+
+
+if __name__ == "__main__":
+    test_normalize_feat_tensor()
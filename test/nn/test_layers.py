@@ -0,0 +1,60 @@
+import torch
+import numpy as np
+import scipy.sparse as sp
+from graphgallery import functional as gf
+from graphgallery.nn.layers.pytorch import SSGConv, ChebConv, GCNConv
+
+
+def random_adj(N=40, density=0.1, seed=42):
+    adj = sp.random(N, N, density=density, random_state=seed, format='csr')
+    adj = ((adj + adj.T) > 0).astype('float32')
+    return gf.normalize_adj(adj)
+
+
+def test_ssgconv():
+    # dense diagonal blocks are propagated in BSR layout if `block_size=4`
+    block_adj = gf.normalize_adj(sp.block_diag([np.ones((4, 4), dtype='float32')] * 10, format='csr'))
+    check_ssgconv(block_adj, torch.sparse_bsr)
+    # a sparse random graph falls back to CSR, its 4x4 blocks are mostly zeros
+    check_ssgconv(random_adj(), torch.sparse_csr)
+
+
+def check_ssgconv(adj, layout):
+    x = torch.rand(adj.shape[0], 8)
+    A = torch.as_tensor(adj.toarray())
+    for K, alpha in [(1, 0.), (2, 0.1), (16, 0.05)]:
+        # (1 - alpha) / K * sum_{k=1}^{K} A^k x + alpha * x
+        h, expected = x, alpha * x
+        for _ in range(K):
+            h = A @ h
+            expected = expected + (1 - alpha) / K * h
+        for sparse_format in ['coo', 'csr']:
+            out = SSGConv(K=K, alpha=alpha)(x, gf.astensor(adj, sparse_format=sparse_format))
+            assert torch.allclose(out, expected, atol=1e-5)
+        conv = SSGConv(K=K, alpha=alpha, block_size=4)
+        out = conv(x, gf.astensor(adj))
+        assert conv._sparse_adj.layout == layout
+        assert torch.allclose(out, expected, atol=1e-5)
+
+
+def test_chebconv():
+    adj = random_adj()
+    basis = gf.cheby_basis(adj, K=2, cache=False)
+    K = len(basis)
+    x = torch.rand(adj.shape[0], 8)
+    conv = ChebConv(8, 4, K=K, bias=True)
+    out = conv(x, gf.astensor(gf.stack_basis(basis), sparse_format='csr'))
+
+    # the reference: a sum of K GCNConv over the basis [T_0, ..., T_{K-1}]
+    expected = 0.
+    for k, T in enumerate(basis):
+        gcn = GCNConv(8, 4, bias=True)
+        gcn.w.weight.data = conv.w.weight.data[k * 4:(k + 1) * 4]
+        gcn.w.bias.data = conv.w.bias.data[k * 4:(k + 1) * 4]
+        expected = expected + gcn(x, gf.astensor(T))
+    assert torch.allclose(out, expected, atol=1e-5)
+
+
+if __name__ == "__main__":
+    test_ssgconv()
+    test_chebconv()